@@ -7,13 +7,20 @@ Analyzes existing articles on the AI Communication Patterns site to identify the
 import argparse
 import json
 import os
-import re
 import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from datetime import datetime
 import frontmatter
 
+from concept_index import (
+    add_site_document,
+    count_concepts,
+    load_concept_index,
+    replace_site_frequencies,
+    write_concept_index,
+)
+
 def extract_article_metadata(content, url):
     """Extract metadata and content from an article."""
     try:
@@ -57,33 +64,14 @@ def extract_headings(content):
 
 def extract_key_concepts(content):
     """Extract key concepts and patterns from article content."""
-    # Simple keyword extraction for AI collaboration concepts
-    key_patterns = [
-        r'\b(?:human-ai|ai-human)\b',
-        r'\bcollaboration\b',
-        r'\biteration\b',
-        r'\bfatigue\b',
-        r'\bvisual\b',
-        r'\bmental model\b',
-        r'\bcommunication pattern\b',
-        r'\bknowledge building\b',
-        r'\bdesign thinking\b',
-        r'\bworkflow\b',
-    ]
-    
-    concepts = {}
-    content_lower = content.lower()
-    
-    for pattern in key_patterns:
-        matches = re.findall(pattern, content_lower)
-        if matches:
-            concept = pattern.replace(r'\b', '').replace('\\', '')
-            concepts[concept] = len(matches)
-    
-    return concepts
+    # Shared vocabulary with research_sources.py, including synonyms and stems
+    return count_concepts(content)
+
+def crawl_site_content(base_url, site_index=None):
+    """Crawl the site to find all articles and extract their content.
 
-def crawl_site_content(base_url):
-    """Crawl the site to find all articles and extract their content."""
+    If site_index is given, each analyzed article's concepts are added to it.
+    """
     print(f"Analyzing site content from: {base_url}")
     
     articles = []
@@ -165,6 +153,8 @@ def crawl_site_content(base_url):
                 }
                 
                 articles.append(metadata)
+                if site_index is not None:
+                    add_site_document(site_index, metadata['key_concepts'])
                 
             except Exception as e:
                 print(f"Error analyzing {url}: {e}")
@@ -210,13 +200,15 @@ def main():
     parser = argparse.ArgumentParser(description='Analyze AI Communication Patterns site content')
     parser.add_argument('--site-url', required=True, help='Base URL of the site to analyze')
     parser.add_argument('--output-file', required=True, help='Output JSON file for analysis results')
+    parser.add_argument('--concept-index', help='Concept index file to update with site frequencies')
     
     args = parser.parse_args()
     
     print("🔍 Starting site content analysis...")
     
-    # Crawl and analyze site content
-    articles = crawl_site_content(args.site_url)  # <-- always defined here
+    # Crawl and analyze site content, collecting site counts for the concept index
+    site_index = {}
+    articles = crawl_site_content(args.site_url, site_index)  # <-- always defined here
     
     if not articles:
         print("⚠️ No articles found or analysis failed")
@@ -250,6 +242,20 @@ def main():
     
     print(f"✅ Site analysis complete. Results saved to {args.output_file}")
     
+    # Only replace the stored site counts when this crawl produced some;
+    # research rates written by research_sources.py are kept either way
+    if args.concept_index and articles:
+        try:
+            concept_index = load_concept_index(args.concept_index)
+        except ValueError as e:
+            print(f"⚠️ {e}; starting a new concept index")
+            concept_index = {}
+        replace_site_frequencies(concept_index, site_index)
+        write_concept_index(args.concept_index, concept_index)
+        print(f"🗂️ Concept index updated: {args.concept_index} ({len(concept_index)} concepts)")
+    elif args.concept_index:
+        print(f"⚠️ Concept index left unchanged: {args.concept_index}")
+    
     # Print summary (only if we actually have articles)
     if articles:
         print(f"\n📈 Summary:")
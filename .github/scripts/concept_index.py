@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+AI Research Agent - Concept Index
+Shared concept vocabulary and a compact on-disk index of site and research frequencies.
+"""
+
+import os
+import re
+import struct
+
+# Canonical concept ids and the surface forms that should map onto them.
+# Plurals and common suffixes are handled by stem_key(), so only list
+# genuinely different spellings here.
+CONCEPT_SYNONYMS = {
+    'human-ai': ['ai-human', 'human and ai', 'ai and human'],
+    'collaboration': ['collaborative', 'collaborate', 'co-creation'],
+    'communication': ['communicate'],
+    'communication-pattern': ['communication patterns'],
+    'creativity': ['creative'],
+    'transparency': ['transparent', 'explainability'],
+    'cognition': ['cognitive'],
+    'iteration': ['iterative', 'iterate'],
+    'interaction': ['interactive'],
+    'mental-model': [],
+    'knowledge-building': [],
+    'design-thinking': [],
+    'workflow': [],
+    'fatigue': [],
+    'visual': [],
+    'trust': [],
+    'interface': [],
+    'design': [],
+    'usability': [],
+    'experience': [],
+    'pattern': [],
+}
+
+_SUFFIXES = ('ations', 'ation', 'ative', 'ities', 'ity', 'ions', 'ion', 'ing', 'ate', 'ive', 'ed')
+
+# Index file layout (little endian):
+#   header: magic, format version, entry count
+#   entry:  id length, id bytes (utf-8), site_docs, site_mentions, research_rate
+# research_rate is mentions per 1000 papers, so runs of different depth compare.
+_MAGIC = b'CIDX'
+_VERSION = 2
+_HEADER = struct.Struct('<4sHI')
+_ID_LEN = struct.Struct('<H')
+_COUNTS = struct.Struct('<III')
+
+def stem_word(word):
+    """Strip a common suffix so related word forms share a key."""
+    for suffix in _SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 4:
+            return word[:-len(suffix)]
+    if word.endswith('s') and not word.endswith('ss') and len(word) > 4:
+        return word[:-1]
+    return word
+
+def stem_key(term):
+    """Lowercase, split on non-alphanumerics and stem each word of a term."""
+    words = re.findall(r'[a-z0-9]+', term.lower())
+    return '-'.join(stem_word(w) for w in words)
+
+_ALIASES = {}
+for _concept, _forms in CONCEPT_SYNONYMS.items():
+    for _form in [_concept] + _forms:
+        _ALIASES[stem_key(_form)] = _concept
+
+_MAX_PHRASE_WORDS = max(len(key.split('-')) for key in _ALIASES)
+
+def normalize_concept(term):
+    """Map a term to its canonical concept id (or its stem key if unknown)."""
+    key = stem_key(term)
+    return _ALIASES.get(key, key)
+
+def count_concepts(text):
+    """Count vocabulary concepts in free text, matching synonyms and stems.
+
+    The longest matching phrase wins, so "communication patterns" counts as
+    communication-pattern rather than communication plus pattern.
+    """
+    words = [stem_word(w) for w in re.findall(r'[a-z0-9]+', text.lower())]
+    counts = {}
+    i = 0
+    while i < len(words):
+        for size in range(min(_MAX_PHRASE_WORDS, len(words) - i), 0, -1):
+            concept = _ALIASES.get('-'.join(words[i:i + size]))
+            if concept:
+                counts[concept] = counts.get(concept, 0) + 1
+                i += size
+                break
+        else:
+            i += 1
+    return counts
+
+def research_rate(frequency, paper_count):
+    """Mentions per 1000 papers, rounded to an integer for storage."""
+    return round(frequency * 1000 / paper_count) if paper_count else 0
+
+def _empty_entry():
+    return {'site_docs': 0, 'site_mentions': 0, 'research_rate': 0}
+
+def replace_site_frequencies(index, site_index):
+    """Replace the site counts in index with those in site_index, keeping research rates."""
+    for entry in index.values():
+        entry['site_docs'] = 0
+        entry['site_mentions'] = 0
+    for concept_id, site_entry in site_index.items():
+        entry = index.setdefault(concept_id, _empty_entry())
+        entry['site_docs'] = site_entry['site_docs']
+        entry['site_mentions'] = site_entry['site_mentions']
+
+def add_site_document(index, concepts):
+    """Add one article's concept counts to the index."""
+    seen = set()
+    for term, count in concepts.items():
+        concept_id = normalize_concept(term)
+        entry = index.setdefault(concept_id, _empty_entry())
+        entry['site_mentions'] += count
+        if concept_id not in seen:
+            entry['site_docs'] += 1
+            seen.add(concept_id)
+
+def set_research_rates(index, frequencies, paper_count):
+    """Replace the research rates with per-concept counts over paper_count papers."""
+    for entry in index.values():
+        entry['research_rate'] = 0
+    for concept_id, frequency in frequencies.items():
+        index.setdefault(concept_id, _empty_entry())['research_rate'] = research_rate(frequency, paper_count)
+
+def index_from_site_analysis(site_analysis):
+    """Build an index from a site analysis JSON, for runs without an index file."""
+    index = {}
+    coverage = site_analysis.get('gaps_analysis', {}).get('concept_coverage', {})
+    for term, stats in coverage.items():
+        entry = index.setdefault(normalize_concept(term), _empty_entry())
+        entry['site_docs'] += stats.get('articles', 0)
+        entry['site_mentions'] += stats.get('count', 0)
+    return index
+
+def write_concept_index(path, index):
+    """Write the index to disk, replacing any existing file atomically."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_HEADER.pack(_MAGIC, _VERSION, len(index)))
+        for concept_id in sorted(index):
+            entry = index[concept_id]
+            encoded = concept_id.encode('utf-8')
+            f.write(_ID_LEN.pack(len(encoded)))
+            f.write(encoded)
+            f.write(_COUNTS.pack(entry['site_docs'], entry['site_mentions'], entry['research_rate']))
+    os.replace(tmp_path, path)
+
+def load_concept_index(path):
+    """Load an index written by write_concept_index. Missing or empty files give {}.
+
+    Raises ValueError if the file is not a complete index in the current format.
+    """
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return {}
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    def unpack(fmt, offset):
+        if len(data) - offset < fmt.size:
+            raise ValueError(f"Unsupported concept index format in {path}: file is truncated")
+        return fmt.unpack_from(data, offset)
+
+    magic, version, count = unpack(_HEADER, 0)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError(f"Unsupported concept index format in {path}")
+
+    index = {}
+    offset = _HEADER.size
+    for _ in range(count):
+        (id_len,) = unpack(_ID_LEN, offset)
+        offset += _ID_LEN.size
+        if len(data) - offset < id_len:
+            raise ValueError(f"Unsupported concept index format in {path}: file is truncated")
+        try:
+            concept_id = data[offset:offset + id_len].decode('utf-8')
+        except UnicodeDecodeError:
+            raise ValueError(f"Unsupported concept index format in {path}: invalid concept id")
+        offset += id_len
+        site_docs, site_mentions, rate = unpack(_COUNTS, offset)
+        offset += _COUNTS.size
+        index[concept_id] = {
+            'site_docs': site_docs,
+            'site_mentions': site_mentions,
+            'research_rate': rate,
+        }
+
+    return index
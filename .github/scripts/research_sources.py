@@ -13,6 +13,22 @@ import time
 from urllib.parse import quote
 import os
 
+from concept_index import (
+    count_concepts,
+    index_from_site_analysis,
+    load_concept_index,
+    research_rate,
+    set_research_rates,
+    write_concept_index,
+)
+
+# Concept ids tracked in research papers. Each must be a CONCEPT_SYNONYMS id.
+COMMON_AI_TERMS = [
+    'collaboration', 'human-ai', 'interaction', 'interface', 'design',
+    'communication', 'trust', 'transparency', 'creativity', 'workflow',
+    'mental-model', 'cognition', 'usability', 'experience', 'pattern'
+]
+
 def search_arxiv(query, max_results=10):
     """Search ArXiv for recent AI collaboration research."""
     print(f"🔬 Searching ArXiv for: {query}")
@@ -151,20 +167,9 @@ def analyze_research_trends(papers):
     # Extract common keywords and themes
     all_text = ' '.join([p['title'] + ' ' + p['summary'] for p in papers])
     
-    # Simple keyword frequency analysis
-    common_ai_terms = [
-        'collaboration', 'human-ai', 'interaction', 'interface', 'design',
-        'communication', 'trust', 'transparency', 'creativity', 'workflow',
-        'mental model', 'cognition', 'usability', 'experience', 'pattern'
-    ]
-    
-    term_frequency = {}
-    text_lower = all_text.lower()
-    
-    for term in common_ai_terms:
-        count = text_lower.count(term)
-        if count > 0:
-            term_frequency[term] = count
+    # Concept frequency analysis using the vocabulary shared with analyze_site.py
+    concept_counts = count_concepts(all_text)
+    term_frequency = {term: concept_counts[term] for term in COMMON_AI_TERMS if term in concept_counts}
     
     # Sort by frequency
     trending_terms = dict(sorted(term_frequency.items(), key=lambda x: x[1], reverse=True))
@@ -176,28 +181,48 @@ def analyze_research_trends(papers):
         'analysis_note': 'Based on keyword frequency in recent research papers'
     }
 
-def identify_research_opportunities(research_data, site_analysis=None):
-    """Identify research opportunities based on external research and site gaps."""
+def identify_research_opportunities(research_data, site_analysis=None, concept_index=None):
+    """Identify research opportunities based on external research and site gaps.
+    
+    Trending terms are concept ids. Site coverage and the previous run's
+    research rate come from concept_index when given; otherwise coverage is
+    built from site_analysis.
+    """
     
     opportunities = []
     
     # Extract trending topics from research
     trends = research_data.get('trends', {})
     trending_terms = trends.get('trending_terms', {})
+    total_papers = trends.get('total_papers', 0)
     
-    # If we have site analysis, compare with existing content
-    covered_topics = set()
-    if site_analysis:
-        gaps = site_analysis.get('gaps_analysis', {})
-        covered_topics = set(gaps.get('concept_coverage', {}).keys())
+    if concept_index is None:
+        concept_index = index_from_site_analysis(site_analysis) if site_analysis else {}
     
     # Identify opportunities
     for term, frequency in trending_terms.items():
         if frequency > 2:  # Only consider reasonably frequent terms
+            entry = concept_index.get(term, {})
+            site_docs = entry.get('site_docs', 0)
+            rate = research_rate(frequency, total_papers)
+            previous_rate = entry.get('research_rate', 0)
+            # Rates are per 1000 papers; changes within 10% count as steady
+            if not previous_rate:
+                research_trend = 'new'
+            elif abs(rate - previous_rate) <= previous_rate // 10:
+                research_trend = 'steady'
+            elif rate > previous_rate:
+                research_trend = 'rising'
+            else:
+                research_trend = 'falling'
             opportunity = {
                 'topic': term,
                 'research_frequency': frequency,
-                'gap_level': 'high' if term not in covered_topics else 'covered',
+                'research_rate': rate,
+                'previous_research_rate': previous_rate,
+                'research_trend': research_trend,
+                'site_document_frequency': site_docs,
+                'gap_level': 'high' if not site_docs else 'covered',
                 'research_basis': f"Appears {frequency} times in recent research",
                 'suggested_focus': generate_focus_suggestion(term, research_data)
             }
@@ -214,7 +239,7 @@ def generate_focus_suggestion(term, research_data):
         'transparency': 'Design experiments around AI explainability and user understanding',
         'creativity': 'Document creative collaboration patterns between humans and AI',
         'workflow': 'Map effective workflow patterns for AI-assisted tasks',
-        'mental model': 'Explore mental model alignment between humans and AI systems',
+        'mental-model': 'Explore mental model alignment between humans and AI systems',
         'communication': 'Study communication patterns that enhance human-AI collaboration',
         'interface': 'Design experiments with new interface paradigms for AI collaboration',
         'experience': 'Document user experience patterns in human-AI collaboration'
@@ -227,6 +252,7 @@ def main():
     parser.add_argument('--depth', choices=['light', 'deep'], default='light', help='Research depth')
     parser.add_argument('--output-file', required=True, help='Output JSON file for research results')
     parser.add_argument('--site-analysis', help='Site analysis JSON file for gap analysis')
+    parser.add_argument('--concept-index', help='Concept index file from analyze_site.py (preferred over --site-analysis)')
     
     args = parser.parse_args()
     
@@ -235,16 +261,33 @@ def main():
     # Perform research
     research_results = research_ai_collaboration_topics(args.depth)
     
-    # Load site analysis if provided
+    # Load the concept index, falling back to the full site analysis
     site_analysis = None
-    if args.site_analysis and os.path.exists(args.site_analysis):
+    concept_index = None
+    if args.concept_index and os.path.exists(args.concept_index):
+        try:
+            concept_index = load_concept_index(args.concept_index)
+        except ValueError as e:
+            print(f"⚠️ {e}; falling back to site analysis")
+    if concept_index is None and args.site_analysis and os.path.exists(args.site_analysis):
         with open(args.site_analysis, 'r') as f:
             site_analysis = json.load(f)
     
     # Identify research opportunities
-    opportunities = identify_research_opportunities(research_results, site_analysis)
+    opportunities = identify_research_opportunities(research_results, site_analysis, concept_index)
     research_results['opportunities'] = opportunities
     
+    # Record research rates alongside the site counts, unless nothing was fetched
+    total_papers = research_results['trends'].get('total_papers', 0)
+    if args.concept_index and total_papers:
+        if concept_index is None:
+            concept_index = index_from_site_analysis(site_analysis) if site_analysis else {}
+        trending_terms = research_results['trends'].get('trending_terms', {})
+        set_research_rates(concept_index, trending_terms, total_papers)
+        write_concept_index(args.concept_index, concept_index)
+    elif args.concept_index:
+        print(f"⚠️ No papers analyzed; concept index left unchanged: {args.concept_index}")
+    
     # Save results
     with open(args.output_file, 'w') as f:
         json.dump(research_results, f, indent=2)
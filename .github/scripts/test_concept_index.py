@@ -0,0 +1,110 @@
+"""Checks for the concept index format and the shared concept vocabulary."""
+
+import pytest
+
+from analyze_site import extract_key_concepts
+from concept_index import (
+    CONCEPT_SYNONYMS,
+    add_site_document,
+    load_concept_index,
+    replace_site_frequencies,
+    set_research_rates,
+    write_concept_index,
+)
+from research_sources import COMMON_AI_TERMS, analyze_research_trends, identify_research_opportunities
+
+
+def build_index():
+    index = {}
+    add_site_document(index, {'collaboration': 3, 'mental-model': 1})
+    add_site_document(index, {'collaboration': 1})
+    set_research_rates(index, {'collaboration': 7, 'trust': 4}, 10)
+    return index
+
+
+def test_round_trip(tmp_path):
+    path = tmp_path / 'concept_index.bin'
+    index = build_index()
+    write_concept_index(str(path), index)
+    assert load_concept_index(str(path)) == index
+
+
+def test_missing_file_loads_empty(tmp_path):
+    assert load_concept_index(str(tmp_path / 'missing.bin')) == {}
+
+
+@pytest.mark.parametrize('cut', [3, 12, 15, 28])
+def test_truncated_file_raises_value_error(tmp_path, cut):
+    path = tmp_path / 'concept_index.bin'
+    write_concept_index(str(path), build_index())
+    path.write_bytes(path.read_bytes()[:cut])
+    with pytest.raises(ValueError, match='Unsupported concept index format'):
+        load_concept_index(str(path))
+
+
+def test_research_terms_are_vocabulary_ids():
+    for term in COMMON_AI_TERMS:
+        assert term in CONCEPT_SYNONYMS, term
+
+
+@pytest.mark.parametrize('concept', COMMON_AI_TERMS)
+def test_site_counts_every_research_concept(concept):
+    for form in [concept] + CONCEPT_SYNONYMS[concept]:
+        assert extract_key_concepts(f'Notes on {form}.') == {concept: 1}, form
+
+
+def test_synonyms_and_stems_are_counted():
+    text = 'Collaborative, iterative design with mental models and workflows; humans and AI co-creation'
+    assert extract_key_concepts(text) == {
+        'collaboration': 2,
+        'iteration': 1,
+        'design': 1,
+        'mental-model': 1,
+        'workflow': 1,
+        'human-ai': 1,
+    }
+
+
+def test_longest_phrase_wins():
+    assert extract_key_concepts('Communication patterns and design thinking') == {
+        'communication-pattern': 1,
+        'design-thinking': 1,
+    }
+
+
+def test_research_trends_use_shared_vocabulary():
+    papers = [
+        {'title': 'Collaborative agents', 'summary': 'Mental models of human-AI collaboration'},
+        {'title': 'Trusted interfaces', 'summary': 'Trust in AI interfaces'},
+    ]
+    trends = analyze_research_trends(papers)
+    assert trends['trending_terms'] == {
+        'collaboration': 2,
+        'trust': 2,
+        'interface': 2,
+        'mental-model': 1,
+        'human-ai': 1,
+    }
+
+
+def test_replace_site_frequencies_keeps_research_rates():
+    index = build_index()
+    site_index = {}
+    add_site_document(site_index, {'trust': 2})
+    replace_site_frequencies(index, site_index)
+    assert index['collaboration'] == {'site_docs': 0, 'site_mentions': 0, 'research_rate': 700}
+    assert index['trust'] == {'site_docs': 1, 'site_mentions': 2, 'research_rate': 400}
+
+
+def test_opportunities_compare_rates_per_paper():
+    research_data = {'trends': {'trending_terms': {'collaboration': 14, 'trust': 3, 'design': 5}, 'total_papers': 20}}
+    opportunities = identify_research_opportunities(research_data, concept_index=build_index())
+    by_topic = {o['topic']: o for o in opportunities}
+
+    # Twice the mentions over twice the papers is the same rate
+    assert by_topic['collaboration']['research_rate'] == 700
+    assert by_topic['collaboration']['research_trend'] == 'steady'
+    assert by_topic['collaboration']['gap_level'] == 'covered'
+    assert by_topic['trust']['research_trend'] == 'falling'
+    assert by_topic['trust']['gap_level'] == 'high'
+    assert by_topic['design']['research_trend'] == 'new'